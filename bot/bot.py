@@ -46,7 +46,7 @@ class ProfessorOakBot(commands.Bot):
         self.logger = get_logger(__name__)
 
         # Database manager
-        self.db = DatabaseManager(db_file)
+        self.db = DatabaseManager(db_file, config.DATABASE_POOL_SIZE)
 
         # Error handling setup
         setup_error_handling(self)
@@ -58,11 +58,14 @@ class ProfessorOakBot(commands.Bot):
         Handles database schema creation and data loading with comprehensive error handling.
         """
         try:
+            # Open the persistent database connection
+            await self.db.connect()
+
             # Create database schema
-            self.db.create_database_schema()
+            await self.db.create_database_schema()
 
             # Load Pokemon data
-            self.db.load_pokemon_data_from_json(self.base_path)
+            await self.db.load_pokemon_data_from_json(self.base_path)
 
             self.logger.info("Database initialization completed successfully.")
 
@@ -109,6 +112,13 @@ class ProfessorOakBot(commands.Bot):
         self.logger.info(f"Professor Oak Bot logged in as {self.user}")
         self.logger.info(f"Connected to {len(self.guilds)} guilds")
 
+    async def close(self):
+        """
+        Shut down the bot, then close the database connection shared with its cogs.
+        """
+        await super().close()
+        await self.db.close()
+
 
 def run_bot(base_path: str):
     """
@@ -123,9 +133,14 @@ def run_bot(base_path: str):
     # Initialize bot
     bot = ProfessorOakBot(base_path)
 
+    async def runner():
+        # Closing the bot on exit also closes its database connections
+        async with bot:
+            await bot.start(config.DISCORD_TOKEN)
+
     try:
         # Run the bot with the token from config
-        asyncio.run(bot.start(config.DISCORD_TOKEN))
+        asyncio.run(runner())
 
     except Exception as e:
         bot.logger.critical(f"Bot startup failed: {e}")
@@ -1,42 +1,103 @@
+import io
 import os
+import asyncio
+import hmac
+import hashlib
 import logging
-from typing import List, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
 
 import discord
 from discord.ext import commands
-import bcrypt
 
 from bot.utils.logger import get_logger
 from bot.models import PokemonSet
 from bot.utils.error_handling import rate_limit
-from bot.cogs.db import DatabaseManager
 
 from config.config import config
 
+# Translation table for normalizing hyphenated names
+_HYPHEN_TO_SPACE = str.maketrans("-", " ")
+
+
+# Recently sent sprite images, keyed by path, so repeat requests skip disk
+_SPRITE_CACHE_SIZE = 256
+_sprite_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+
+def _read_sprite(sprite_path: str) -> bytes:
+    """
+    Read a sprite image from disk.
+
+    Args:
+        sprite_path (str): Path to the sprite image
+
+    Returns:
+        bytes: Sprite image data
+    """
+    with open(sprite_path, "rb") as f:
+        return f.read()
+
+
+async def _load_sprite(sprite_path: str) -> bytes:
+    """
+    Get a sprite image, reading it off the event loop only on a cache miss.
+
+    Args:
+        sprite_path (str): Path to the sprite image
+
+    Returns:
+        bytes: Sprite image data
+    """
+    sprite = _sprite_cache.get(sprite_path)
+    if sprite is not None:
+        _sprite_cache.move_to_end(sprite_path)
+        return sprite
+
+    sprite = await asyncio.to_thread(_read_sprite, sprite_path)
+    _sprite_cache[sprite_path] = sprite
+    if len(_sprite_cache) > _SPRITE_CACHE_SIZE:
+        _sprite_cache.popitem(last=False)
+    return sprite
+
 
 class PokemonCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = DatabaseManager()
+        self.db = bot.db
         self.logger = get_logger(__name__)
-        self.hashed_password = self._hash_admin_password()
 
-    def _hash_admin_password(self) -> bytes:
+        # Rendered get-command embeds and sprite paths, keyed by Pokemon name
+        self._embed_cache: Dict[str, Tuple[dict, str]] = {}
+        self._embed_cache_generation = 0
+
+        # Keyed digest of the admin password, computed once per process
+        self._admin_key = os.urandom(32)
+        self._admin_digest = (
+            self._digest_password(config.ADMIN_PASSWORD)
+            if config.ADMIN_PASSWORD
+            else None
+        )
+
+    def _digest_password(self, password: str) -> bytes:
         """
-        Securely hash the admin password during initialization.
+        Compute a keyed BLAKE2b digest of a password.
+
+        Args:
+            password (str): Password to digest
 
         Returns:
-            bytes: Hashed password
+            bytes: 32-byte digest
         """
-        try:
-            return bcrypt.hashpw(config.ADMIN_PASSWORD.encode(), bcrypt.gensalt())
-        except Exception as e:
-            self.logger.error(f"Password hashing failed: {e}")
-            raise
+        return hashlib.blake2b(
+            password.encode(), key=self._admin_key, digest_size=32
+        ).digest()
 
     def _validate_admin_password(self, provided_password: str) -> bool:
         """
-        Validate the provided admin password.
+        Validate the provided admin password by comparing keyed digests in
+        constant time.
 
         Args:
             provided_password (str): Password to validate
@@ -44,8 +105,14 @@ class PokemonCommands(commands.Cog):
         Returns:
             bool: Whether password is valid
         """
+        if self._admin_digest is None:
+            self.logger.error("Admin password is not configured.")
+            return False
+
         try:
-            return bcrypt.checkpw(provided_password.encode(), self.hashed_password)
+            return hmac.compare_digest(
+                self._admin_digest, self._digest_password(provided_password)
+            )
         except Exception as e:
             self.logger.error(f"Password validation error: {e}")
             return False
@@ -60,7 +127,64 @@ class PokemonCommands(commands.Cog):
         Returns:
             str: Formatted Pokemon name
         """
-        return name.lower().replace("-", " ")
+        return name.lower().translate(_HYPHEN_TO_SPACE)
+
+    def _sprite_cdn_url(self, sprite_path: str) -> str:
+        """
+        Build the CDN URL for a sprite from its local file name.
+
+        Args:
+            sprite_path (str): Local path to the sprite image
+
+        Returns:
+            str: Sprite URL under config.SPRITE_BASE_URL
+        """
+        file_name = quote(os.path.basename(sprite_path))
+        return f"{config.SPRITE_BASE_URL.rstrip('/')}/{file_name}"
+
+    def _invalidate_embed_cache(self, pokemon: Optional[str] = None):
+        """
+        Drop a Pokemon's cached embed, or clear the whole embed cache.
+
+        Args:
+            pokemon (str, optional): Formatted name of the Pokemon to drop
+        """
+        # Lookups already in flight must not store what they rendered
+        self._embed_cache_generation += 1
+
+        if pokemon is None:
+            self._embed_cache.clear()
+        else:
+            self._embed_cache.pop(pokemon, None)
+
+    def _build_sets_embed(
+        self, title: str, random_sets: List[PokemonSet]
+    ) -> discord.Embed:
+        """
+        Build the embed listing a Pokemon's sets.
+
+        Args:
+            title (str): Display name of the Pokemon
+            random_sets (List[PokemonSet]): Sets to list
+
+        Returns:
+            discord.Embed: Embed with one field per set
+        """
+        embed = discord.Embed(
+            title=f"{title}'s Random Sets", color=discord.Color.green()
+        )
+
+        # Format all sets up front, then add them to the embed
+        set_texts = [
+            f"**Item:** {set_data.item}\n"
+            f"**Moves:**\n"
+            + "\n".join(f"• {move}" for move in set_data.moves)
+            for set_data in random_sets
+        ]
+        for i, set_text in enumerate(set_texts, 1):
+            embed.add_field(name=f"Set {i}", value=set_text, inline=False)
+
+        return embed
 
     def _validate_moves_and_item(self, moves: List[str], item: str) -> bool:
         """
@@ -122,8 +246,8 @@ class PokemonCommands(commands.Cog):
 
             # Normalize names
             pokemon = self._format_pokemon_name(pokemon)
-            item = item.replace("-", " ")
-            moves = [move.replace("-", " ") for move in moves]
+            item = item.translate(_HYPHEN_TO_SPACE)
+            moves = [move.translate(_HYPHEN_TO_SPACE) for move in moves]
 
             # Validate moves and item
             if not self._validate_moves_and_item(moves, item):
@@ -132,6 +256,7 @@ class PokemonCommands(commands.Cog):
             # Add Pokemon set
             new_set = PokemonSet(item=item, moves=moves)
             await self.db.add_pokemon_set(pokemon, new_set)
+            self._invalidate_embed_cache(pokemon)
 
             # Confirmation message
             await ctx.send(
@@ -155,37 +280,40 @@ class PokemonCommands(commands.Cog):
         try:
             # Normalize Pokemon name
             pokemon = self._format_pokemon_name(pokemon)
-            pokemon_data = await self.db.get_pokemon_data(pokemon)
-
-            if not pokemon_data.random_sets:
-                await ctx.send(f"No sets found for {pokemon.title()}.")
+            title = pokemon.title()
+
+            cached = self._embed_cache.get(pokemon)
+            generation = self._embed_cache_generation
+            if cached is None:
+                pokemon_data = await self.db.get_pokemon_data(pokemon)
+
+                if not pokemon_data.random_sets:
+                    await ctx.send(f"No sets found for {title}.")
+                    return
+
+                sprite_url = pokemon_data.sprite_url
+                embed = self._build_sets_embed(title, pokemon_data.random_sets)
+                if generation == self._embed_cache_generation:
+                    self._embed_cache[pokemon] = (embed.to_dict(), sprite_url)
+            else:
+                embed_data, sprite_url = cached
+                embed = discord.Embed.from_dict(embed_data)
+
+            # Let Discord pull the sprite from the CDN when one is configured
+            if config.SPRITE_BASE_URL:
+                embed.set_thumbnail(url=self._sprite_cdn_url(sprite_url))
+                await ctx.send(embed=embed)
                 return
 
-            # Create embed for better visualization
-            embed = discord.Embed(
-                title=f"{pokemon.title()}'s Random Sets", color=discord.Color.green()
-            )
-
-            # Add Pokemon sprite to embed
-            embed.set_thumbnail(url=f"attachment://sprite.png")
-
-            # Add sets to embed
-            for i, set_data in enumerate(pokemon_data.random_sets, 1):
-                set_text = (
-                    f"**Item:** {set_data['item']}\n"
-                    f"**Moves:**\n"
-                    + "\n".join(f"• {move}" for move in set_data["moves"])
-                )
-                embed.add_field(name=f"Set {i}", value=set_text, inline=False)
-
-            # Send the sprite as a file attachment
-            with open(pokemon_data.sprite_url, "rb") as f:
-                sprite = discord.File(f, filename="sprite.png")
+            # Otherwise attach the sprite, read from disk only on a cache miss
+            sprite_bytes = await _load_sprite(sprite_url)
+            embed.set_thumbnail(url="attachment://sprite.png")
+            sprite = discord.File(io.BytesIO(sprite_bytes), filename="sprite.png")
 
             await ctx.send(file=sprite, embed=embed)
 
         except FileNotFoundError:
-            await ctx.send(f"No data found for {pokemon.title()}.")
+            await ctx.send(f"No data found for {title}.")
         except Exception as e:
             self.logger.error(f"Set retrieval error: {e}")
             await ctx.send("❌ An error occurred while retrieving sets.")
@@ -203,6 +331,7 @@ class PokemonCommands(commands.Cog):
         try:
             pokemon = self._format_pokemon_name(pokemon)
             await self.db.delete_pokemon_set(pokemon, set_id)
+            self._invalidate_embed_cache(pokemon)
             await ctx.send(
                 f"✅ Set {set_id} for {pokemon.title()} deleted successfully."
             )
@@ -225,6 +354,7 @@ class PokemonCommands(commands.Cog):
 
         try:
             await self.db.reset_database()
+            self._invalidate_embed_cache()
             await ctx.send("✅ Database has been reset successfully.")
 
         except Exception as e:
@@ -1,134 +1,498 @@
 import os
-import json
-import sqlite3
-from typing import Dict, Any, List
+import copy
+import asyncio
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Dict, Any, AsyncIterator, Iterator, List, Optional
+
+import aiosqlite
+import orjson
 
 from bot.models import PokemonData, PokemonSet
 from bot.utils.logger import get_logger
 
+# Pokemon table columns. Names compare case-insensitively, so the UNIQUE
+# index on `name` serves lookups directly
+_POKEMON_COLUMNS_SQL = """
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE COLLATE NOCASE,
+    sprite_url TEXT NOT NULL,
+    random_sets TEXT DEFAULT '[]'
+"""
+
+# Statements run on every command, kept as constants so each one is parsed
+# once and then served from the connection's statement cache
+_SELECT_POKEMON_ID_SQL = "SELECT id FROM pokemon WHERE name = ?"
+
+_SELECT_POKEMON_SQL = """
+    SELECT id, name, sprite_url
+    FROM pokemon
+    WHERE name = ?
+"""
+
+_SELECT_POKEMON_SETS_SQL = """
+    SELECT item, m1, m2, m3, m4
+    FROM pokemon_sets
+    WHERE pokemon_id = ?
+    ORDER BY slot
+"""
+
+# Looks the Pokemon up by name and appends the set after its last slot
+_INSERT_POKEMON_SET_SQL = """
+    INSERT INTO pokemon_sets (pokemon_id, slot, item, m1, m2, m3, m4)
+    SELECT
+        p.id,
+        (
+            SELECT COALESCE(MAX(slot) + 1, 0)
+            FROM pokemon_sets
+            WHERE pokemon_id = p.id
+        ),
+        ?, ?, ?, ?, ?
+    FROM pokemon AS p
+    WHERE p.name = ?
+"""
+
+# Deletes the set at the given position in slot order
+_DELETE_POKEMON_SET_SQL = """
+    DELETE FROM pokemon_sets
+    WHERE rowid = (
+        SELECT rowid
+        FROM pokemon_sets
+        WHERE pokemon_id = ?
+        ORDER BY slot
+        LIMIT 1 OFFSET ?
+    )
+"""
+
+
+class ConnectionPool:
+    """
+    A fixed-size pool of long-lived SQLite connections.
+
+    Each connection keeps its own page cache warm across queries, and under
+    WAL journaling the pooled connections can read concurrently. Connections
+    are opened read-only and memory-map the database, so pages are shared
+    through the OS page cache rather than copied into every connection.
+    """
+
+    def __init__(self, db_file: str, size: int = 4):
+        """
+        Initialize the pool without opening any connections.
+
+        Args:
+            db_file (str): Path to the SQLite database file
+            size (int, optional): Number of connections to keep open
+
+        Raises:
+            ValueError: If size is less than 1
+        """
+        # An empty pool would leave every lookup waiting forever
+        if size < 1:
+            raise ValueError(f"Connection pool size must be at least 1, got {size}")
+
+        self.db_file = db_file
+        self.size = size
+        self._connections: List[aiosqlite.Connection] = []
+        self._available: asyncio.Queue = asyncio.Queue()
+        self._opened = False
+
+    async def open(self):
+        """
+        Open the pooled connections, closing any already opened if one fails.
+        """
+        db_uri = f"{Path(self.db_file).resolve().as_uri()}?mode=ro"
+
+        try:
+            for _ in range(self.size):
+                conn = await aiosqlite.connect(db_uri, uri=True)
+                self._connections.append(conn)
+                await conn.executescript(
+                    """
+                    PRAGMA cache_size=-20000;
+                    PRAGMA mmap_size=268435456;
+                    """
+                )
+                self._available.put_nowait(conn)
+        except Exception:
+            await self.close()
+            raise
+
+        self._opened = True
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Borrow a connection, waiting for one to be returned if all are in use.
+
+        Yields:
+            aiosqlite.Connection: Pooled database connection
+
+        Raises:
+            RuntimeError: If the pool is not open
+        """
+        # Waiting on a pool that was never opened would block forever
+        if not self._opened:
+            raise RuntimeError("Connection pool is not open")
+
+        conn = await self._available.get()
+        try:
+            yield conn
+        finally:
+            self._available.put_nowait(conn)
+
+    async def close(self):
+        """
+        Close every pooled connection.
+        """
+        self._opened = False
+        for conn in self._connections:
+            await conn.close()
+        self._connections.clear()
+        self._available = asyncio.Queue()
+
 
 class DatabaseManager:
-    def __init__(self, db_file: str = "pokemon_sets_data.db"):
+    def __init__(
+        self,
+        db_file: str = "pokemon_sets_data.db",
+        pool_size: int = 4,
+        cache_size: int = 256,
+    ):
         """
         Initialize the database manager with logging and connection handling.
 
         Args:
             db_file (str): Path to the SQLite database file
+            pool_size (int, optional): Number of pooled read connections
+            cache_size (int, optional): Number of Pokemon lookups to cache.
+                Only safe while this process is the database's sole writer;
+                pass 0 to disable.
         """
         self.db_file = db_file
         self.logger = get_logger(__name__)
-        self._connection = None
-        self._cursor = None
+        self.conn: Optional[aiosqlite.Connection] = None
+        self.pool = ConnectionPool(db_file, pool_size)
+
+        # Writes share one connection, and with it one transaction, so they
+        # must not interleave between their first statement and commit/rollback
+        self._write_lock = asyncio.Lock()
 
-    def _establish_connection(self):
+        # Least recently used cache of Pokemon lookups, keyed by lowercase name
+        self._cache: "OrderedDict[str, PokemonData]" = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_generation = 0
+
+    async def connect(self) -> aiosqlite.Connection:
         """
-        Establish a database connection with error handling.
+        Open the persistent database connection and apply connection pragmas,
+        then open the read connection pool.
+
+        WAL journaling lets readers proceed while a write is in progress, so
+        concurrent commands no longer serialize on the database file.
 
         Returns:
-            sqlite3.Connection: Database connection
+            aiosqlite.Connection: Database connection
         """
+        if self.conn is not None:
+            return self.conn
+
+        conn = None
         try:
-            self._connection = sqlite3.connect(self.db_file)
-            self._cursor = self._connection.cursor()
-            return self._connection
-        except sqlite3.Error as e:
+            conn = await aiosqlite.connect(self.db_file)
+            await conn.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA cache_size=-20000;
+                """
+            )
+            await self.pool.open()
+        except Exception as e:
+            # Leave nothing half-open, so a retry connects from scratch
+            if conn is not None:
+                await conn.close()
             self.logger.error(f"Database connection error: {e}")
             raise
 
-    def _close_connection(self):
+        self.conn = conn
+        self.logger.info("Database connection established.")
+        return self.conn
+
+    async def close(self):
         """
-        Safely close the database connection.
+        Safely close the database connection and the read connection pool.
         """
         try:
-            if self._connection:
-                self._connection.close()
-                self._connection = None
-                self._cursor = None
-        except sqlite3.Error as e:
+            await self.pool.close()
+            if self.conn:
+                await self.conn.close()
+                self.conn = None
+        except aiosqlite.Error as e:
             self.logger.error(f"Error closing database connection: {e}")
 
-    def create_database_schema(self):
+    async def create_database_schema(self):
         """
         Create the database schema if it doesn't exist.
         """
         try:
-            self._establish_connection()
-            self._cursor.execute(
+            await self.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS pokemon ({_POKEMON_COLUMNS_SQL})"
+            )
+            await self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pokemon_sets (
+                    pokemon_id INTEGER NOT NULL REFERENCES pokemon(id),
+                    slot INTEGER NOT NULL,
+                    item TEXT NOT NULL,
+                    m1 TEXT NOT NULL,
+                    m2 TEXT NOT NULL,
+                    m3 TEXT NOT NULL,
+                    m4 TEXT NOT NULL
+                )
+                """
+            )
+
+            # Drop the pre-composite index left in older databases
+            await self.conn.execute("DROP INDEX IF EXISTS idx_pokemon_sets_pokemon_id")
+            await self.conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_pokemon_sets_pokemon_id_slot
+                ON pokemon_sets (pokemon_id, slot)
                 """
-                CREATE TABLE IF NOT EXISTS pokemon (
-                    id INTEGER PRIMARY KEY,
-                    name TEXT NOT NULL UNIQUE,
-                    sprite_url TEXT NOT NULL,
-                    random_sets TEXT DEFAULT '[]'
+            )
+            await self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
                 )
                 """
             )
-            self._connection.commit()
+            await self.conn.commit()
+
+            # Rebuild tables created before names were declared NOCASE
+            await self._migrate_name_collation()
+
+            # Move sets still stored in the legacy JSON column
+            await self._migrate_legacy_random_sets()
+
             self.logger.info("Database schema created successfully.")
-        except sqlite3.Error as e:
+        except aiosqlite.Error as e:
             self.logger.error(f"Schema creation error: {e}")
             raise
-        finally:
-            self._close_connection()
 
-    def load_pokemon_data_from_json(self, base_path: str):
+    async def _migrate_name_collation(self):
         """
-        Load Pokemon data from a JSON file into the database.
+        Rebuild a `pokemon` table whose `name` column predates the NOCASE
+        collation, which also drops the expression index it used instead.
+        """
+        async with self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'pokemon'"
+        ) as cursor:
+            result = await cursor.fetchone()
+
+        if "COLLATE NOCASE" in result[0]:
+            return
+
+        try:
+            await self.conn.executescript(
+                f"""
+                BEGIN;
+                CREATE TABLE pokemon_rebuild ({_POKEMON_COLUMNS_SQL});
+                INSERT INTO pokemon_rebuild (id, name, sprite_url, random_sets)
+                SELECT id, name, sprite_url, random_sets FROM pokemon;
+                DROP TABLE pokemon;
+                ALTER TABLE pokemon_rebuild RENAME TO pokemon;
+                COMMIT;
+                """
+            )
+        except aiosqlite.Error:
+            await self.conn.rollback()
+            raise
+
+        self.logger.info("Rebuilt pokemon table with case-insensitive names.")
+
+    async def _migrate_legacy_random_sets(self):
+        """
+        Move sets stored in the legacy `pokemon.random_sets` JSON column into
+        the `pokemon_sets` table.
+        """
+        async with self.conn.execute(
+            "SELECT id, random_sets FROM pokemon WHERE random_sets != '[]'"
+        ) as cursor:
+            legacy_rows = await cursor.fetchall()
+
+        if not legacy_rows:
+            return
+
+        rows = [
+            (pokemon_id, slot, legacy_set["item"], *legacy_set["moves"])
+            for pokemon_id, random_sets_json in legacy_rows
+            for slot, legacy_set in enumerate(orjson.loads(random_sets_json))
+        ]
+
+        await self.conn.executemany(
+            """
+            INSERT INTO pokemon_sets (pokemon_id, slot, item, m1, m2, m3, m4)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        await self.conn.execute(
+            "UPDATE pokemon SET random_sets = '[]' WHERE random_sets != '[]'"
+        )
+        await self.conn.commit()
+        self.logger.info(f"Migrated {len(rows)} legacy Pokemon sets.")
+
+    def _list_files(self, directory: Path) -> set:
+        """
+        List the names of the regular files in a directory.
 
         Args:
-            base_path (str): Base path for sprite images
+            directory (Path): Directory to list
+
+        Returns:
+            set: File names, empty if the directory doesn't exist
         """
         try:
-            # Validate JSON file exists
-            json_path = "bot/data/national_dex.json"
-            if not os.path.exists(json_path):
-                raise FileNotFoundError(f"Pokemon data file not found: {json_path}")
-
-            # Read JSON data
-            with open(json_path, "r") as f:
-                pokemon_data = json.load(f)
-
-            # Establish connection
-            self._establish_connection()
-
-            # Insert Pokemon data
-            for name, data in pokemon_data.items():
-                try:
-                    # Construct absolute sprite path
-                    relative_path = data["image_path"].replace("\\", "/")
-                    absolute_path = os.path.join(base_path, relative_path)
-
-                    # Validate sprite exists
-                    if not os.path.exists(absolute_path):
-                        self.logger.warning(
-                            f"Sprite not found for {name}: {absolute_path}"
-                        )
-                        continue
-
-                    # Insert or ignore Pokemon
-                    self._cursor.execute(
-                        """
-                        INSERT OR IGNORE INTO pokemon 
-                        (id, name, sprite_url, random_sets) 
-                        VALUES (?, ?, ?, ?)
-                        """,
-                        (data["id"], name, absolute_path, "[]"),
-                    )
-                except sqlite3.IntegrityError:
-                    self.logger.warning(f"Duplicate entry for {name}")
-
-            # Commit and close
-            self._connection.commit()
-            self.logger.info("Pokemon data loaded successfully.")
-        except Exception as e:
-            self.logger.error(f"Error loading Pokemon data: {e}")
-            raise
-        finally:
-            self._close_connection()
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            return set()
+
+    def _iter_pokemon_rows(self, json_path: Path, base_path: Path) -> Iterator[tuple]:
+        """
+        Yield Pokemon rows from the JSON file, skipping Pokemon without a sprite.
+
+        This does blocking file I/O and is meant to be consumed off the event
+        loop, such as by the connection's worker thread in executemany.
+
+        Args:
+            json_path (Path): Path to the Pokemon data file
+            base_path (Path): Base path for sprite images
+
+        Yields:
+            tuple: (id, name, sprite_url) row ready for insertion
+        """
+        # Read JSON data
+        with open(json_path, "rb") as f:
+            pokemon_data = orjson.loads(f.read())
+
+        # List each sprite directory once rather than stat-ing every sprite
+        sprite_files: Dict[Path, set] = {}
+
+        # Resolve sprite paths, skipping Pokemon without a sprite on disk
+        for name, data in pokemon_data.items():
+            sprite_path = base_path / data["image_path"].replace("\\", "/")
+
+            sprite_dir = sprite_path.parent
+            if sprite_dir not in sprite_files:
+                sprite_files[sprite_dir] = self._list_files(sprite_dir)
+
+            if sprite_path.name not in sprite_files[sprite_dir]:
+                self.logger.warning(f"Sprite not found for {name}: {sprite_path}")
+                continue
+
+            yield data["id"], name, str(sprite_path)
+
+    async def load_pokemon_data_from_json(self, base_path: str):
+        """
+        Load Pokemon data from a JSON file into the database.
+
+        The load is skipped when the JSON file is unchanged since the last
+        successful load, as recorded by its modification time in `meta`.
+
+        Args:
+            base_path (str): Base path for sprite and data files
+        """
+        # Keep other writes out of the load transaction
+        async with self._write_lock:
+            try:
+                # Validate JSON file exists, independent of the working directory
+                base_path = Path(base_path)
+                json_path = base_path / "bot" / "data" / "national_dex.json"
+                if not json_path.is_file():
+                    raise FileNotFoundError(f"Pokemon data file not found: {json_path}")
+
+                # Skip the load if the JSON file hasn't changed since the last one
+                dex_mtime = str(json_path.stat().st_mtime_ns)
+                async with self.conn.execute(
+                    "SELECT value FROM meta WHERE key = 'national_dex_mtime'"
+                ) as cursor:
+                    result = await cursor.fetchone()
+
+                if result and result[0] == dex_mtime:
+                    self.logger.info("Pokemon data is up to date, skipping load.")
+                    return
+
+                # Insert all Pokemon in a single transaction. The rows are streamed
+                # from the file on the connection's worker thread as they are
+                # inserted, rather than collected into a list first
+                await self.conn.executemany(
+                    """
+                    INSERT INTO pokemon
+                    (id, name, sprite_url)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT DO NOTHING
+                    """,
+                    self._iter_pokemon_rows(json_path, base_path),
+                )
+                await self.conn.execute(
+                    """
+                    INSERT INTO meta (key, value)
+                    VALUES ('national_dex_mtime', ?)
+                    ON CONFLICT(key) DO UPDATE SET value = excluded.value
+                    """,
+                    (dex_mtime,),
+                )
+                await self.conn.commit()
+                self.logger.info("Pokemon data loaded successfully.")
+            except Exception as e:
+                await self.conn.rollback()
+                self.logger.error(f"Error loading Pokemon data: {e}")
+                raise
+
+    async def _get_pokemon_id(self, pokemon_name: str) -> int:
+        """
+        Retrieve a Pokemon's id by name.
+
+        Args:
+            pokemon_name (str): Name of the Pokemon
+
+        Returns:
+            int: Pokemon id
+
+        Raises:
+            ValueError: If Pokemon not found
+        """
+        async with self.conn.execute(_SELECT_POKEMON_ID_SQL, (pokemon_name,)) as cursor:
+            result = await cursor.fetchone()
+
+        if not result:
+            raise ValueError(f"Pokemon '{pokemon_name}' not found!")
+
+        return result[0]
+
+    def _invalidate_cache(self, pokemon_name: Optional[str] = None):
+        """
+        Drop a Pokemon from the lookup cache, or clear the whole cache.
+
+        Args:
+            pokemon_name (str, optional): Name of the Pokemon to drop
+        """
+        # Lookups already in flight must not store what they read
+        self._cache_generation += 1
+
+        if pokemon_name is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(pokemon_name.lower(), None)
 
     async def get_pokemon_data(self, pokemon_name: str) -> PokemonData:
         """
-        Retrieve Pokemon data by name.
+        Retrieve Pokemon data by name, serving repeat lookups from memory.
 
         Args:
             pokemon_name (str): Name of the Pokemon
@@ -139,30 +503,43 @@ class DatabaseManager:
         Raises:
             ValueError: If Pokemon not found
         """
+        cache_key = pokemon_name.lower()
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+
+        generation = self._cache_generation
+
         try:
-            self._establish_connection()
-            self._cursor.execute(
-                """
-                SELECT id, name, sprite_url, random_sets
-                FROM pokemon
-                WHERE LOWER(name) = LOWER(?)
-                """,
-                (pokemon_name,),
-            )
+            async with self.pool.acquire() as conn:
+                async with conn.execute(
+                    _SELECT_POKEMON_SQL, (pokemon_name,)
+                ) as cursor:
+                    result = await cursor.fetchone()
+
+                if not result:
+                    raise ValueError(f"Pokemon '{pokemon_name}' not found!")
 
-            result = self._cursor.fetchone()
-            if not result:
-                raise ValueError(f"Pokemon '{pokemon_name}' not found!")
+                id, name, sprite_url = result
 
-            id, name, sprite_url, random_sets_json = result
-            random_sets = json.loads(random_sets_json)
+                async with conn.execute(_SELECT_POKEMON_SETS_SQL, (id,)) as cursor:
+                    random_sets = [
+                        PokemonSet(item, list(moves))
+                        for item, *moves in await cursor.fetchall()
+                    ]
 
-            return PokemonData(id, name, sprite_url, random_sets)
-        except sqlite3.Error as e:
+            pokemon_data = PokemonData(id, name, sprite_url, random_sets)
+        except aiosqlite.Error as e:
             self.logger.error(f"Database retrieval error: {e}")
             raise
-        finally:
-            self._close_connection()
+
+        if self._cache_size and generation == self._cache_generation:
+            self._cache[cache_key] = pokemon_data
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+        return copy.deepcopy(pokemon_data)
 
     async def add_pokemon_set(self, pokemon_name: str, new_set: PokemonSet):
         """
@@ -172,33 +549,24 @@ class DatabaseManager:
             pokemon_name (str): Name of the Pokemon
             new_set (PokemonSet): Set to be added
         """
-        try:
-            # Retrieve existing Pokemon data
-            pokemon_data = await self.get_pokemon_data(pokemon_name)
-
-            # Establish connection
-            self._establish_connection()
-
-            # Update sets
-            random_sets = pokemon_data.random_sets
-            random_sets.append(vars(new_set))
+        # Serialize writes so a rollback only undoes this one
+        async with self._write_lock:
+            try:
+                # Append the set in a single statement
+                cursor = await self.conn.execute(
+                    _INSERT_POKEMON_SET_SQL,
+                    (new_set.item, *new_set.moves, pokemon_name),
+                )
+                if cursor.rowcount == 0:
+                    raise ValueError(f"Pokemon '{pokemon_name}' not found!")
 
-            # Update database
-            self._cursor.execute(
-                """
-                UPDATE pokemon
-                SET random_sets = ?
-                WHERE id = ?
-                """,
-                (json.dumps(random_sets), pokemon_data.id),
-            )
-            self._connection.commit()
-            self.logger.info(f"Added new set for {pokemon_name}")
-        except Exception as e:
-            self.logger.error(f"Error adding Pokemon set: {e}")
-            raise
-        finally:
-            self._close_connection()
+                await self.conn.commit()
+                self._invalidate_cache(pokemon_name)
+                self.logger.info(f"Added new set for {pokemon_name}")
+            except Exception as e:
+                await self.conn.rollback()
+                self.logger.error(f"Error adding Pokemon set: {e}")
+                raise
 
     async def delete_pokemon_set(self, pokemon_name: str, set_index: int):
         """
@@ -211,54 +579,48 @@ class DatabaseManager:
         Raises:
             ValueError: If set index is invalid
         """
-        try:
-            # Retrieve existing Pokemon data
-            pokemon_data = await self.get_pokemon_data(pokemon_name)
-
-            # Validate set index
-            if set_index < 0 or set_index >= len(pokemon_data.random_sets):
-                raise ValueError(f"Invalid set index for {pokemon_name}")
-
-            # Establish connection
-            self._establish_connection()
-
-            # Remove the set
-            random_sets = pokemon_data.random_sets
-            del random_sets[set_index]
+        # Serialize writes so a rollback only undoes this one
+        async with self._write_lock:
+            try:
+                pokemon_id = await self._get_pokemon_id(pokemon_name)
+
+                # Validate set index
+                if set_index < 0:
+                    raise ValueError(f"Invalid set index for {pokemon_name}")
+
+                # Remove the set at the given position
+                cursor = await self.conn.execute(
+                    _DELETE_POKEMON_SET_SQL, (pokemon_id, set_index)
+                )
+                if cursor.rowcount == 0:
+                    raise ValueError(f"Invalid set index for {pokemon_name}")
 
-            # Update database
-            self._cursor.execute(
-                """
-                UPDATE pokemon
-                SET random_sets = ?
-                WHERE id = ?
-                """,
-                (json.dumps(random_sets), pokemon_data.id),
-            )
-            self._connection.commit()
-            self.logger.info(f"Deleted set {set_index} for {pokemon_name}")
-        except Exception as e:
-            self.logger.error(f"Error deleting Pokemon set: {e}")
-            raise
-        finally:
-            self._close_connection()
+                await self.conn.commit()
+                self._invalidate_cache(pokemon_name)
+                self.logger.info(f"Deleted set {set_index} for {pokemon_name}")
+            except Exception as e:
+                await self.conn.rollback()
+                self.logger.error(f"Error deleting Pokemon set: {e}")
+                raise
 
     async def reset_database(self):
         """
         Reset the entire database by dropping and recreating the schema.
         """
-        try:
-            self._establish_connection()
-
-            # Drop existing table
-            self._cursor.execute("DROP TABLE IF EXISTS pokemon")
-
-            # Recreate schema
-            self.create_database_schema()
-
-            self.logger.info("Database reset successfully.")
-        except Exception as e:
-            self.logger.error(f"Database reset error: {e}")
-            raise
-        finally:
-            self._close_connection()
+        # Keep other writes out of the reset
+        async with self._write_lock:
+            try:
+                # Drop existing tables, including the load marker so the
+                # Pokemon data is reloaded on the next startup
+                await self.conn.execute("DROP TABLE IF EXISTS pokemon")
+                await self.conn.execute("DROP TABLE IF EXISTS pokemon_sets")
+                await self.conn.execute("DROP TABLE IF EXISTS meta")
+
+                # Recreate schema
+                await self.create_database_schema()
+                self._invalidate_cache()
+
+                self.logger.info("Database reset successfully.")
+            except Exception as e:
+                self.logger.error(f"Database reset error: {e}")
+                raise
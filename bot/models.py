@@ -2,13 +2,13 @@ from typing import List
 from dataclasses import dataclass
 
 # Data classes for type safety and better structure
-@dataclass
+@dataclass(slots=True)
 class PokemonSet:
     """Represents a single set of moves and items for a Pokemon"""
     item: str
     moves: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class PokemonData:
     """Contains all information about a Pokemon, including its sets and asset locations"""
     id: int
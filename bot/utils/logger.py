@@ -1,13 +1,18 @@
 import os
 import logging
-from logging.handlers import RotatingFileHandler
+from functools import lru_cache
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from config.config import config
 
 
+@lru_cache(maxsize=None)
 def configure_logger(logger_name: str = None, log_file: str = None):
     """
     Configure a comprehensive logger with file and console output.
 
+    Configuration is memoized per (logger_name, log_file), so repeated calls
+    return the same logger without rebuilding its handlers.
+
     Args:
         logger_name (str, optional): Name of the logger. Defaults to config.LOGGER_NAME.
         log_file (str, optional): Path to the log file. Defaults to config.LOGGER_FILE_NAME.
@@ -28,7 +33,8 @@ def configure_logger(logger_name: str = None, log_file: str = None):
 
     # Ensure log directory exists
     log_dir = os.path.dirname(log_file)
-    os.makedirs(log_dir, exist_ok=True)
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
 
     # File Handler with log rotation
     file_handler = RotatingFileHandler(
@@ -37,6 +43,7 @@ def configure_logger(logger_name: str = None, log_file: str = None):
         maxBytes=10 * 1024 * 1024,  # 10 MB max file size
         backupCount=5,  # Keep 5 backup files
         encoding="utf-8",
+        delay=True,  # Open the file on first write
     )
     file_handler.setLevel(logging.INFO)
     file_formatter = logging.Formatter(
@@ -45,6 +52,12 @@ def configure_logger(logger_name: str = None, log_file: str = None):
     )
     file_handler.setFormatter(file_formatter)
 
+    # Buffer file writes, flushing on errors or once the buffer fills up
+    buffered_handler = MemoryHandler(
+        capacity=256, flushLevel=logging.ERROR, target=file_handler
+    )
+    buffered_handler.setLevel(logging.INFO)
+
     # Console Handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
@@ -54,16 +67,12 @@ def configure_logger(logger_name: str = None, log_file: str = None):
     console_handler.setFormatter(console_formatter)
 
     # Add handlers to logger
-    logger.addHandler(file_handler)
+    logger.addHandler(buffered_handler)
     logger.addHandler(console_handler)
 
     return logger
 
 
-# Create a global logger instance
-logger = configure_logger()
-
-
 def get_logger(name: str = None):
     """
     Get a child logger for a specific module.
@@ -74,4 +83,6 @@ def get_logger(name: str = None):
     Returns:
         logging.Logger: Child logger instance
     """
+    # Configure the global logger on first use rather than at import time
+    logger = configure_logger()
     return logger.getChild(name) if name else logger
@@ -1,22 +1,13 @@
 import os
 import shutil
+from pathlib import Path
 
-def clean_python_cache(directory: str):
-    # Walk through all the subdirectories and files in the given directory
-    for root, dirs, files in os.walk(directory, topdown=False):
-        # Delete .pyc files
-        for file in files:
-            if file.endswith('.pyc'):
-                file_path = os.path.join(root, file)
-                print(f"Deleting file: {file_path}")
-                os.remove(file_path)
-        
-        # Delete __pycache__ directories
-        for dir in dirs:
-            if dir == '__pycache__':
-                dir_path = os.path.join(root, dir)
-                print(f"Deleting directory: {dir_path}")
-                shutil.rmtree(dir_path)
+def clean_python_cache(directory: str, verbose: bool = False):
+    # Every .pyc lives inside a __pycache__ directory, so removing those covers both
+    for cache_dir in list(Path(directory).rglob('__pycache__')):
+        if verbose:
+            print(f"Deleting directory: {cache_dir}")
+        shutil.rmtree(cache_dir, ignore_errors=True)
 
 # Run the function with the desired directory, or use the current directory
 if __name__ == "__main__":
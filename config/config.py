@@ -14,9 +14,12 @@ class Config:
 
     DATABASE_FILE = os.getenv("DATABASE_FILE", "pokemon_sets_data.db")
     DATABASE_URL = os.getenv("DATABASE_URL")
+    DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE") or 4)
 
     COMMAND_PREFIX = os.getenv("COMMAND_PREFIX", "!oak")
 
+    SPRITE_BASE_URL = os.getenv("SPRITE_BASE_URL")
+
     LOGGER_NAME = "pokemon_bot"
     LOGGER_FILE_NAME = "logs/pokemon_bot.log"
 
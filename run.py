@@ -38,9 +38,11 @@ class BotApplication:
         self.bot: Optional[ProfessorOakBot] = None
         self.web_app: Optional[web.Application] = None
         self.web_runner: Optional[web.AppRunner] = None
+        self.bot_task: Optional[asyncio.Task] = None
 
-        # Shutdown management
-        self.shutdown_event = asyncio.Event()
+        # Shutdown management, created once the event loop is running
+        self.shutdown_event: Optional[asyncio.Event] = None
+        self.shutdown_wait_task: Optional[asyncio.Task] = None
 
     def _setup_signal_handlers(self):
         """
@@ -60,7 +62,8 @@ class BotApplication:
         Request graceful shutdown of the application.
         """
         self.logger.info("Shutdown signal received. Initiating graceful shutdown...")
-        self.shutdown_event.set()
+        if self.shutdown_event:
+            self.shutdown_event.set()
 
     async def _create_web_server(self):
         """
@@ -104,16 +107,30 @@ class BotApplication:
         try:
             # Configure event loop
             self.loop = asyncio.get_running_loop()
+            self.shutdown_event = asyncio.Event()
             self._setup_signal_handlers()
 
             # Start web server for health checks
             self.web_runner = await self._create_web_server()
 
             # Start Discord bot in the background
-            bot_task = asyncio.create_task(self._start_bot())
+            self.bot_task = asyncio.create_task(self._start_bot())
 
-            # Wait for shutdown signal
-            await self.shutdown_event.wait()
+            # Wait for a shutdown signal or for the bot to stop on its own
+            self.shutdown_wait_task = asyncio.create_task(self.shutdown_event.wait())
+            done, _ = await asyncio.wait(
+                [self.bot_task, self.shutdown_wait_task],
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+
+            # Surface a bot crash instead of waiting for a signal
+            if self.bot_task in done:
+                bot_error = self.bot_task.exception()
+                if bot_error:
+                    self.logger.error(f"Discord bot crashed: {bot_error}")
+                    sys.exit(1)
+
+                self.logger.info("Discord bot stopped.")
 
         except Exception as e:
             self.logger.error(f"Application startup error: {e}")
@@ -139,14 +156,20 @@ class BotApplication:
             await self.bot.close()
             self.logger.info("Discord bot connection closed.")
 
-        # Cancel any remaining tasks
-        for task in asyncio.all_tasks(self.loop):
-            if not task.done():
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+        # Close database connections, even if the bot closed itself earlier
+        if self.bot:
+            await self.bot.db.close()
+            self.logger.info("Database connections closed.")
+
+        # Cancel the application's own tasks, leaving unrelated tasks alone
+        tasks = [
+            task
+            for task in (self.bot_task, self.shutdown_wait_task)
+            if task and not task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
         self.logger.info("Application shutdown complete.")
 